@@ -1,16 +1,38 @@
 # backend/main.py
 import os
-import json
+import asyncio
+import hashlib
+import multiprocessing
+import re
+import signal
+import tempfile
+from string import Template
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
-from io import BytesIO
 
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
 from google import genai
 from google.genai import types
-from pypdf import PdfReader
-from models import ContradictionRequest, ContradictionResponse
+from redis import RedisError
+from redis.asyncio import Redis
+import httpx
+from models import (
+    BatchRequest,
+    BatchResponse,
+    BatchResultItem,
+    ContradictionRequest,
+    ContradictionResponse,
+    parse_contradiction_request,
+    parse_contradiction_response,
+)
+from pdf_worker import extract_page_range, read_pdf
 
 load_dotenv()
 
@@ -19,130 +41,446 @@ API_KEY = os.getenv("GEMINI_API_KEY")
 if not API_KEY:
     raise ValueError("GEMINI_API_KEY environment variable not set.")
 
-client = genai.Client(api_key=API_KEY)
+# Gemini client and its pooled HTTP/2 transport, created per app lifespan so
+# requests reuse warm TCP/TLS connections instead of handshaking per call
+gemini_http: httpx.AsyncClient | None = None
+client: genai.Client | None = None
 MODEL_NAME = "gemini-2.5-flash"
 
-SESSION_HISTORY: dict[str, list[dict]] = {}
+# Every PDF is parsed in worker processes (see pdf_worker.py): MuPDF is not
+# thread-safe and holds the GIL, so it must not run on the event loop or in
+# the thread pool. PDFs with at least this many pages are split across workers.
+PDF_PARALLEL_MIN_PAGES = 32
+PDF_PROCESS_WORKERS = min(4, os.cpu_count() or 1)
+PDF_PROCESS_POOL: ProcessPoolExecutor | None = None
+
+# Long PDFs are condensed to head + safety-relevant passages + tail before extraction
+PDF_TEXT_MAX_CHARS = 10000
+PDF_TEXT_HEAD_CHARS = 8000
+PDF_TEXT_TAIL_CHARS = 2000
+PDF_TEXT_KEYWORD_CHARS = 4000
+SAFETY_KEYWORDS = re.compile(
+    r"adverse|safety|claim|tolerab|side effect|case report|hepatotox|rash|death",
+    re.IGNORECASE,
+)
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+
+# Number of streamed Gemini chunks batched into one SSE frame
+STREAM_FLUSH_EVERY = 10
+
+# Caps concurrent Gemini calls from all endpoints to stay under provider rate limits
+GEMINI_CONCURRENCY = asyncio.Semaphore(32)
+
+# Session history lives in Redis when REDIS_URL is set, so it is shared across
+# workers and expires on its own. Without it, history falls back to a
+# per-process store that is not shared between uvicorn/gunicorn workers.
+REDIS_URL = os.getenv("REDIS_URL")
+SESSION_HISTORY_SIZE = 5
+SESSION_TTL_SECONDS = 24 * 60 * 60
+redis_client: Redis | None = None
+
+SESSION_HISTORY: defaultdict[str, deque[dict]] = defaultdict(
+    lambda: deque(maxlen=SESSION_HISTORY_SIZE)
+)
+
+
+class LRUCache:
+    """Small in-process LRU cache for Gemini results, keyed by content hash."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, object] = OrderedDict()
+
+    def get(self, key: str):
+        if key not in self._data:
+            return None
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def put(self, key: str, value) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
 
+def content_key(*parts: str) -> str:
+    """Stable short digest of the given strings, used as a cache key."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
 
-def store_result(session_id: str, result: ContradictionResponse) -> None:
+
+# Repeat uploads / retries of the same content skip the Gemini round trip
+EXTRACTION_CACHE = LRUCache(maxsize=512)
+ANALYSIS_CACHE = LRUCache(maxsize=512)
+
+# Gemini analysis calls currently in flight, keyed on trial claim + case report so
+# identical analyses from different sessions share one call
+ANALYSIS_INFLIGHT: dict[str, asyncio.Task] = {}
+
+
+def session_key(session_id: str) -> str:
+    """Redis list key holding a session's recent analyses."""
+    return f"sess:{session_id}"
+
+
+async def store_result(session_id: str, result: ContradictionResponse) -> None:
     """Stores the latest analysis result, keeping only the last 5."""
-    if session_id not in SESSION_HISTORY:
-        SESSION_HISTORY[session_id] = []
+    entry = result.model_dump()
+    if redis_client is None:
+        SESSION_HISTORY[session_id].append(entry)
+        return
+
+    key = session_key(session_id)
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.lpush(key, orjson.dumps(entry))
+            pipe.ltrim(key, 0, SESSION_HISTORY_SIZE - 1)
+            pipe.expire(key, SESSION_TTL_SECONDS)
+            await pipe.execute()
+    except RedisError as e:
+        # History is best-effort; never fail an analysis that already succeeded
+        print(f"Redis error storing session history: {e}")
 
-    SESSION_HISTORY[session_id].append(result.model_dump())
-    SESSION_HISTORY[session_id] = SESSION_HISTORY[session_id][-5:]
 
+async def get_session_history(session_id: str) -> list[dict]:
+    """Returns the stored analyses for a session, oldest first."""
+    if redis_client is None:
+        return list(SESSION_HISTORY.get(session_id, ()))
 
-def get_rag_context() -> str:
+    try:
+        items = await redis_client.lrange(
+            session_key(session_id), 0, SESSION_HISTORY_SIZE - 1
+        )
+    except RedisError as e:
+        print(f"Redis error reading session history: {e}")
+        return []
+    return [orjson.loads(item) for item in reversed(items)]
+
+
+RAG_PATH = os.path.join(os.path.dirname(__file__), "rag_corpus.txt")
+
+
+def load_rag_context() -> str:
     """Reads the minimal RAG corpus from a local file."""
-    base_dir = os.path.dirname(__file__)
-    rag_path = os.path.join(base_dir, "rag_corpus.txt")
     try:
-        with open(rag_path, "r", encoding="utf-8") as f:
+        with open(RAG_PATH, "r", encoding="utf-8") as f:
             return f.read()
     except FileNotFoundError:
         return "No external safety data available (rag_corpus.txt not found)."
 
+
+def set_rag_context(rag_context: str) -> None:
+    """Installs a freshly read RAG corpus into the app-wide cache."""
+    app.state.rag_context = rag_context
+    # Cached analyses were grounded on the previous corpus
+    ANALYSIS_CACHE.clear()
+    print("RAG corpus loaded.")
+
+
+async def reload_rag_context() -> None:
+    """Re-reads the RAG corpus (at startup and on SIGHUP) without blocking the event loop."""
+    set_rag_context(await asyncio.to_thread(load_rag_context))
+
+
+def get_rag_context() -> str:
+    """Returns the RAG corpus cached at startup."""
+    rag_context = getattr(app.state, "rag_context", None)
+    if rag_context is None:
+        set_rag_context(load_rag_context())
+        rag_context = app.state.rag_context
+    return rag_context
+
+
+def pdf_pool_context() -> multiprocessing.context.BaseContext:
+    """
+    Start method for PDF workers. Workers start lazily inside this already
+    multi-threaded process, so never fork it; forkserver/spawn start clean
+    interpreters that only import pdf_worker.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global PDF_PROCESS_POOL, redis_client, gemini_http, client
+
+    gemini_http = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
+    client = genai.Client(
+        api_key=API_KEY,
+        http_options=types.HttpOptions(
+            timeout=60_000,  # milliseconds
+            httpx_async_client=gemini_http,
+        ),
+    )
+
+    # Bounded pool for blocking file I/O offloaded via asyncio.to_thread
+    executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+    PDF_PROCESS_POOL = ProcessPoolExecutor(
+        max_workers=PDF_PROCESS_WORKERS, mp_context=pdf_pool_context()
+    )
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(executor)
+
+    if REDIS_URL:
+        redis_client = Redis.from_url(REDIS_URL)
+
+    await reload_rag_context()
+    if hasattr(signal, "SIGHUP"):
+        try:
+            # Keep a reference on app.state so the reload task is not garbage-collected
+            loop.add_signal_handler(
+                signal.SIGHUP,
+                lambda: setattr(app.state, "rag_reload", asyncio.create_task(reload_rag_context())),
+            )
+        except (NotImplementedError, RuntimeError):
+            # Signal handlers can only be installed from the main thread
+            pass
+
     print("Application Startup: AI Pharmacovigilance Tracker MVP is online.")
     yield
+    executor.shutdown(wait=False)
+    await gemini_http.aclose()
+    gemini_http = None
+    client = None
+    if redis_client is not None:
+        await redis_client.aclose()
+        redis_client = None
+    if PDF_PROCESS_POOL is not None:
+        PDF_PROCESS_POOL.shutdown(wait=False, cancel_futures=True)
+        PDF_PROCESS_POOL = None
     print("Application Shutdown.")
 
 
 app = FastAPI(lifespan=lifespan)
 
-origins = [
+origins = frozenset({
     "http://localhost:3000",
-    "http://localhost:5173", 
-    "https://ai-pharmacovigilance.vercel.app"
-]
+    "http://localhost:5173",
+    "https://ai-pharmacovigilance.vercel.app",
+})
+
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
+    allow_credentials=False,
+    allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["*"],
 )
 
-def extract_text_from_pdf_bytes(pdf_bytes: bytes) -> str:
+# Analysis results (reasoning + regulatory draft + heatmap) run to several KB;
+# bodies under 1 KB are sent uncompressed. SSE streams are left uncompressed.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
+async def extract_text_from_pdf_bytes(pdf_bytes: bytes) -> str:
     """
-    Extracts plain text from a PDF byte stream using pypdf.
-    NOTE: Works for text-based PDFs. Scanned-image PDFs will appear empty.
+    Extracts plain text from a PDF byte stream using PyMuPDF in the PDF process pool.
+    Large PDFs are split into page ranges parsed in parallel worker processes.
+    NOTE: Scanned-image PDFs are rejected once no page yields text; image-only
+    pages are skipped.
     """
+    loop = asyncio.get_running_loop()
     try:
-        reader = PdfReader(BytesIO(pdf_bytes))
-        pages_text: list[str] = []
-        for page in reader.pages:
-            page_text = page.extract_text() or ""
-            pages_text.append(page_text)
+        # Workers open a spooled copy on disk rather than each receiving a
+        # pickled copy of the whole PDF
+        with tempfile.NamedTemporaryFile(suffix=".pdf") as spool:
+            await asyncio.to_thread(spool.write, pdf_bytes)
+            await asyncio.to_thread(spool.flush)
+
+            page_count, pages_text, scanned = await loop.run_in_executor(
+                PDF_PROCESS_POOL, read_pdf, spool.name, PDF_PARALLEL_MIN_PAGES
+            )
+            if scanned:
+                raise HTTPException(
+                    status_code=400,
+                    detail="No extractable text found in PDF (it may be a scanned image).",
+                )
+
+            if pages_text is None:
+                step = -(-page_count // PDF_PROCESS_WORKERS)
+                page_ranges = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            PDF_PROCESS_POOL,
+                            extract_page_range,
+                            spool.name,
+                            start,
+                            min(start + step, page_count),
+                        )
+                        for start in range(0, page_count, step)
+                    )
+                )
+                pages_text = [text for texts in page_ranges for text in texts]
+
         return "\n\n".join(pages_text)
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"PDF parsing error: {e}")
         raise HTTPException(status_code=400, detail="Could not read PDF content.")
 
-async def extract_request_from_pdf_text(pdf_text: str) -> ContradictionRequest:
+
+def condense_pdf_text(pdf_text: str) -> str:
     """
-    Uses Gemini to read the PDF text and extract:
-      - trial_claim
-      - case_report
-      - session_id
-    into a ContradictionRequest object.
+    Trims long PDF text to keep the extraction prompt small: the opening section,
+    sentences from the middle that mention safety keywords, and the closing section.
     """
-    system_instruction = """
-    You are an information extraction assistant for pharmacovigilance.
-    You will be given the raw text of a clinical / pharmacovigilance PDF.
+    if len(pdf_text) <= PDF_TEXT_MAX_CHARS:
+        return pdf_text
+
+    head = pdf_text[:PDF_TEXT_HEAD_CHARS]
+    tail = pdf_text[-PDF_TEXT_TAIL_CHARS:]
+    middle = pdf_text[PDF_TEXT_HEAD_CHARS:-PDF_TEXT_TAIL_CHARS]
+
+    # PyMuPDF emits one line per text line, so sentences are the useful unit
+    relevant: list[str] = []
+    budget = PDF_TEXT_KEYWORD_CHARS
+    for passage in SENTENCE_BOUNDARY.split(middle):
+        passage = " ".join(passage.split())
+        if not passage or len(passage) > budget or not SAFETY_KEYWORDS.search(passage):
+            continue
+        relevant.append(passage)
+        budget -= len(passage)
+
+    parts = [head, "...[truncated]..."]
+    if relevant:
+        parts += relevant + ["...[truncated]..."]
+    parts.append(tail)
+    return "\n".join(parts)
+
+
+# --- Prompts and generation configs (built once at import) ---
+EXTRACT_SYSTEM_INSTRUCTION = """
+You are an information extraction assistant for pharmacovigilance.
+You will be given the raw text of a clinical / pharmacovigilance PDF.
+
+Your task is to extract THREE fields required by the ContradictionRequest schema:
+
+- trial_claim: The primary safety claim from a trial, label, SmPC, or key clinical summary.
+  This is usually a statement that the drug is safe, well-tolerated, or free
+  from specific adverse events or safety risks.
+
+- case_report: The description of post-market adverse event(s) or safety signal(s)
+  that are being reported in the document. This will usually look like a patient
+  case description, adverse event report, or pharmacovigilance narrative.
+
+- session_id: A short identifier string that can be used to track this PDF.
+  If there is a natural ID in the document (e.g. case ID, report ID, trial ID),
+  use that. Otherwise, create a concise snake_case identifier based on the drug
+  name and a short label, e.g. "drugX_case_1".
+
+IMPORTANT:
+- Always return valid JSON that matches the ContradictionRequest Pydantic schema.
+- Never return null values. If you truly cannot find a field, set a best-effort value
+  like "Unknown trial claim" or "Unknown case report" or "auto_session_1".
+"""
+
+EXTRACT_USER_TEMPLATE = Template("""
+Below is the extracted text from a single PDF document.
+
+--- BEGIN PDF TEXT ---
+$pdf_text
+--- END PDF TEXT ---
+
+Extract and return:
+- trial_claim
+- case_report
+- session_id
+
+Respond ONLY with JSON compatible with the ContradictionRequest schema.
+""")
+
+ANALYZE_SYSTEM_INSTRUCTION = """
+You are a highly-experienced Pharmacovigilance Analyst.
+Your task is to critically compare Document A (Trial Claim) and Document B (Case Report)
+to detect a definitive contradiction regarding the drug's safety profile, grounded by the
+provided RAG Context. You must provide a JSON response that strictly adheres to the
+ContradictionResponse Pydantic schema.
+"""
+
+ANALYZE_USER_TEMPLATE = Template("""
+--- RAG Context (External Safety Data) ---
+$rag_context
+
+--- Session History (Last 5 Analyses: verdict, confidence, top adverse event) ---
+$history_json
+
+--- Analysis Request ---
+Document A (Trial Claim): "$trial_claim"
+Document B (Case Report/ADR): "$case_report"
+
+Based on the documents and context, is there a material safety contradiction?
+""")
+
+EXTRACT_CONFIG = types.GenerateContentConfig(
+    system_instruction=EXTRACT_SYSTEM_INSTRUCTION,
+    response_mime_type="application/json",
+    response_schema=ContradictionRequest,
+)
 
-    Your task is to extract THREE fields required by the ContradictionRequest schema:
+ANALYZE_CONFIG = types.GenerateContentConfig(
+    system_instruction=ANALYZE_SYSTEM_INSTRUCTION,
+    response_mime_type="application/json",
+    response_schema=ContradictionResponse,
+)
 
-    - trial_claim: The primary safety claim from a trial, label, SmPC, or key clinical summary.
-      This is usually a statement that the drug is safe, well-tolerated, or free
-      from specific adverse events or safety risks.
 
-    - case_report: The description of post-market adverse event(s) or safety signal(s)
-      that are being reported in the document. This will usually look like a patient
-      case description, adverse event report, or pharmacovigilance narrative.
+async def stream_gemini(
+    user_prompt: str, config: types.GenerateContentConfig
+) -> AsyncIterator[str]:
+    """Streams the Gemini response text chunk by chunk."""
+    stream = await client.aio.models.generate_content_stream(
+        model=MODEL_NAME,
+        contents=[user_prompt],
+        config=config,
+    )
+    async for chunk in stream:
+        if chunk.text:
+            yield chunk.text
 
-    - session_id: A short identifier string that can be used to track this PDF.
-      If there is a natural ID in the document (e.g. case ID, report ID, trial ID),
-      use that. Otherwise, create a concise snake_case identifier based on the drug
-      name and a short label, e.g. "drugX_case_1".
 
-    IMPORTANT:
-    - Always return valid JSON that matches the ContradictionRequest Pydantic schema.
-    - Never return null values. If you truly cannot find a field, set a best-effort value
-      like "Unknown trial claim" or "Unknown case report" or "auto_session_1".
-    """
+async def generate_gemini_text(
+    user_prompt: str, config: types.GenerateContentConfig
+) -> str:
+    """Streams the Gemini response and returns the accumulated text."""
+    async with GEMINI_CONCURRENCY:
+        return "".join([text async for text in stream_gemini(user_prompt, config)])
 
-    user_prompt = f"""
-    Below is the extracted text from a single PDF document.
 
-    --- BEGIN PDF TEXT ---
-    {pdf_text}
-    --- END PDF TEXT ---
+async def extract_request_from_pdf_text(pdf_text: str) -> ContradictionRequest:
+    """
+    Uses Gemini to read the PDF text and extract:
+      - trial_claim
+      - case_report
+      - session_id
+    into a ContradictionRequest object.
+    """
+    pdf_text = condense_pdf_text(pdf_text)
 
-    Extract and return:
-    - trial_claim
-    - case_report
-    - session_id
+    user_prompt = EXTRACT_USER_TEMPLATE.substitute(pdf_text=pdf_text)
 
-    Respond ONLY with JSON compatible with the ContradictionRequest schema.
-    """
+    cache_key = content_key(pdf_text)
+    cached = EXTRACTION_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
 
     try:
-        response = await client.aio.models.generate_content(
-            model=MODEL_NAME,
-            contents=[user_prompt],
-            config=types.GenerateContentConfig(
-                system_instruction=system_instruction,
-                response_mime_type="application/json",
-                response_schema=ContradictionRequest,
-            ),
-        )
+        response_text = await generate_gemini_text(user_prompt, EXTRACT_CONFIG)
 
-        extracted_request = ContradictionRequest.model_validate_json(response.text)
+        extracted_request = parse_contradiction_request(response_text)
+        EXTRACTION_CACHE.put(cache_key, extracted_request)
         return extracted_request
 
     except Exception as e:
@@ -153,48 +491,74 @@ async def extract_request_from_pdf_text(pdf_text: str) -> ContradictionRequest:
         raise HTTPException(status_code=500, detail="Failed to extract data from PDF.")
 
 
-async def analyze_with_gemini(request: ContradictionRequest) -> ContradictionResponse:
-    """Calls the Gemini LLM to detect contradictions."""
-    rag_context = get_rag_context()
-    session_history = SESSION_HISTORY.get(
-        request.session_id, "No prior history for this session."
+def compact_history(entries: list[dict]) -> list[dict]:
+    """
+    Reduces stored analyses to the fields the model needs as context (verdict,
+    confidence, top heatmap event), dropping the long reasoning and draft text.
+    """
+    return [
+        {
+            "verdict": entry["contradiction_detected"],
+            "confidence": round(entry["signal_confidence_score"], 2),
+            "top_event": (
+                entry["safety_contradiction_heatmap"][0]["adverse_event"]
+                if entry.get("safety_contradiction_heatmap")
+                else None
+            ),
+        }
+        for entry in entries
+    ]
+
+
+async def build_analysis_prompt(request: ContradictionRequest) -> str:
+    """Builds the contradiction-analysis prompt for a request."""
+    session_history = compact_history(await get_session_history(request.session_id)) or (
+        "No prior history for this session."
     )
+    history_json = orjson.dumps(session_history).decode()
 
-    system_instruction = """
-    You are a highly-experienced Pharmacovigilance Analyst.
-    Your task is to critically compare Document A (Trial Claim) and Document B (Case Report)
-    to detect a definitive contradiction regarding the drug's safety profile, grounded by the
-    provided RAG Context. You must provide a JSON response that strictly adheres to the
-    ContradictionResponse Pydantic schema.
-    """
+    return ANALYZE_USER_TEMPLATE.substitute(
+        rag_context=get_rag_context(),
+        history_json=history_json,
+        trial_claim=request.trial_claim,
+        case_report=request.case_report,
+    )
 
-    user_prompt = f"""
-    --- RAG Context (External Safety Data) ---
-    {rag_context}
 
-    --- Session History (Last 5 Analyses) ---
-    {json.dumps(session_history, indent=2)}
+def analysis_cache_key(request: ContradictionRequest) -> str:
+    """Repeats of the same claim + case report within a session share a result."""
+    return content_key(request.trial_claim, request.case_report, request.session_id)
 
-    --- Analysis Request ---
-    Document A (Trial Claim): "{request.trial_claim}"
-    Document B (Case Report/ADR): "{request.case_report}"
 
-    Based on the documents and context, is there a material safety contradiction?
+async def record_analysis(request: ContradictionRequest, result: ContradictionResponse) -> None:
     """
+    Caches a fresh analysis and stores it in the session history, once per
+    cache key; results already served from the cache are not stored again.
+    """
+    cache_key = analysis_cache_key(request)
+    if ANALYSIS_CACHE.get(cache_key) is not None:
+        return
+    ANALYSIS_CACHE.put(cache_key, result)
+    await store_result(request.session_id, result)
+
 
+async def call_gemini_analysis(
+    request: ContradictionRequest, on_text: Callable[[str], None] | None = None
+) -> ContradictionResponse:
+    """
+    Runs one Gemini analysis call for a request.
+    on_text, if given, receives each streamed text chunk as it arrives.
+    """
     try:
-        response = await client.aio.models.generate_content(
-            model=MODEL_NAME,
-            contents=[user_prompt],
-            config=types.GenerateContentConfig(
-                system_instruction=system_instruction,
-                response_mime_type="application/json",
-                response_schema=ContradictionResponse,
-            ),
-        )
+        user_prompt = await build_analysis_prompt(request)
+        parts: list[str] = []
+        async with GEMINI_CONCURRENCY:
+            async for text in stream_gemini(user_prompt, ANALYZE_CONFIG):
+                parts.append(text)
+                if on_text is not None:
+                    on_text(text)
 
-        llm_output = ContradictionResponse.model_validate_json(response.text)
-        return llm_output
+        return parse_contradiction_response("".join(parts))
 
     except Exception as e:
         import traceback
@@ -204,17 +568,53 @@ async def analyze_with_gemini(request: ContradictionRequest) -> ContradictionRes
         raise HTTPException(status_code=500, detail="LLM analysis failed.")
 
 
+def start_analysis(
+    request: ContradictionRequest, on_text: Callable[[str], None] | None = None
+) -> tuple[asyncio.Task, bool]:
+    """
+    Returns the in-flight analysis for this claim + case report, starting one if
+    none is running. The flag is True when this call started it (and on_text is
+    attached); callers joining an existing call get no partial chunks.
+    """
+    flight_key = content_key(request.trial_claim, request.case_report)
+    task = ANALYSIS_INFLIGHT.get(flight_key)
+    if task is not None:
+        return task, False
+
+    task = asyncio.create_task(call_gemini_analysis(request, on_text))
+    ANALYSIS_INFLIGHT[flight_key] = task
+    task.add_done_callback(lambda _: ANALYSIS_INFLIGHT.pop(flight_key, None))
+    return task, True
+
+
+async def analyze_with_gemini(request: ContradictionRequest) -> ContradictionResponse:
+    """
+    Calls the Gemini LLM to detect contradictions and records the result in the
+    session history. Identical concurrent requests share a single in-flight call.
+    """
+    cached = ANALYSIS_CACHE.get(analysis_cache_key(request))
+    if cached is not None:
+        return cached
+
+    task, _ = start_analysis(request)
+    # Shield so one caller disconnecting does not cancel the call for the others
+    result = await asyncio.shield(task)
+    await record_analysis(request, result)
+    return result
+
+
+def sse_event(event: str, data: str) -> str:
+    """Formats a single Server-Sent Event frame."""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
 @app.post("/api/v1/analyze", response_model=ContradictionResponse)
 async def analyze_contradiction(request: ContradictionRequest):
     """
     Accepts two text snippets and a session ID, analyzes for contradictions using Gemini,
     and returns a structured result.
     """
-    analysis_result = await analyze_with_gemini(request)
-
-    store_result(request.session_id, analysis_result)
-
-    return analysis_result
+    return await analyze_with_gemini(request)
 
 @app.post("/api/v1/analyze-pdf", response_model=ContradictionResponse)
 async def analyze_contradiction_from_pdf(file: UploadFile = File(...)):
@@ -232,7 +632,11 @@ async def analyze_contradiction_from_pdf(file: UploadFile = File(...)):
     if not pdf_bytes:
         raise HTTPException(status_code=400, detail="Empty file.")
 
-    pdf_text = extract_text_from_pdf_bytes(pdf_bytes)
+    # Parsed in the PDF process pool so concurrent requests keep making progress
+    pdf_text = await extract_text_from_pdf_bytes(pdf_bytes)
+    # Release the upload before the (slow) Gemini calls
+    del pdf_bytes
+    await file.close()
     if not pdf_text.strip():
         raise HTTPException(
             status_code=400,
@@ -241,10 +645,75 @@ async def analyze_contradiction_from_pdf(file: UploadFile = File(...)):
 
     extracted_request = await extract_request_from_pdf_text(pdf_text)
 
-    analysis_result = await analyze_with_gemini(extracted_request)
+    return await analyze_with_gemini(extracted_request)
 
-    store_result(extracted_request.session_id, analysis_result)
 
-    return analysis_result
+@app.post("/api/v1/analyze-batch", response_model=BatchResponse)
+async def analyze_contradiction_batch(request: BatchRequest):
+    """
+    Accepts a list of contradiction requests and analyzes them concurrently.
+    Failed items are returned as error entries instead of failing the whole batch.
+    """
+    outcomes = await asyncio.gather(
+        *(analyze_with_gemini(item) for item in request.items), return_exceptions=True
+    )
 
+    results: list[BatchResultItem] = []
+    for item, outcome in zip(request.items, outcomes):
+        if isinstance(outcome, HTTPException):
+            results.append(BatchResultItem(session_id=item.session_id, error=outcome.detail))
+            continue
+        if isinstance(outcome, BaseException):
+            import traceback
 
+            traceback.print_exception(outcome)
+            print(f"Batch item analysis error: {outcome}")
+            results.append(
+                BatchResultItem(session_id=item.session_id, error="LLM analysis failed.")
+            )
+            continue
+
+        results.append(BatchResultItem(session_id=item.session_id, result=outcome))
+
+    return BatchResponse(results=results)
+
+
+@app.post("/api/v1/analyze-stream")
+async def analyze_contradiction_stream(request: ContradictionRequest):
+    """
+    Same analysis as /api/v1/analyze, streamed as Server-Sent Events:
+      - "chunk": partial JSON text ({"text": ...}), batched every few model chunks
+      - "result": the validated ContradictionResponse once generation completes
+      - "error": analysis failed
+    """
+    async def event_stream() -> AsyncIterator[str]:
+        cached = ANALYSIS_CACHE.get(analysis_cache_key(request))
+        if cached is not None:
+            yield sse_event("result", cached.model_dump_json())
+            return
+
+        # Same coalescing and concurrency cap as /api/v1/analyze; the client that
+        # starts the call receives its chunks, clients joining it get the result
+        chunks: asyncio.Queue[str | None] = asyncio.Queue()
+        task, started = start_analysis(request, on_text=chunks.put_nowait)
+        if started:
+            task.add_done_callback(lambda _: chunks.put_nowait(None))
+            pending: list[str] = []
+            while (text := await chunks.get()) is not None:
+                pending.append(text)
+                if len(pending) >= STREAM_FLUSH_EVERY:
+                    yield sse_event("chunk", orjson.dumps({"text": "".join(pending)}).decode())
+                    pending.clear()
+            if pending:
+                yield sse_event("chunk", orjson.dumps({"text": "".join(pending)}).decode())
+
+        try:
+            llm_output = await asyncio.shield(task)
+        except HTTPException as e:
+            yield sse_event("error", orjson.dumps({"detail": e.detail}).decode())
+            return
+
+        await record_analysis(request, llm_output)
+        yield sse_event("result", llm_output.model_dump_json())
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
@@ -1,9 +1,14 @@
 # backend/models.py
-from pydantic import BaseModel, Field
+from typing import Annotated, get_args, get_origin
+
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field
 
 # --- New Model for Heatmap Entry ---
 class HeatmapEntry(BaseModel):
     """Represents a single entry in the Safety Contradiction Heatmap."""
+    model_config = ConfigDict(frozen=True)
+
     adverse_event: str = Field(
         ...,
         description="The specific adverse event (e.g., 'Hepatotoxicity', 'Severe Rash')."
@@ -30,6 +35,8 @@ class HeatmapEntry(BaseModel):
 
 class ContradictionRequest(BaseModel):
     """Data sent from the frontend to the analysis endpoint."""
+    model_config = ConfigDict(frozen=True)
+
     trial_claim: str = Field(
         ...,
         description="The primary safety claim from a trial or label."
@@ -48,6 +55,8 @@ class ContradictionResponse(BaseModel):
     The structured output from the Gemini LLM and the final API response,
     matching the project's Core Goal outputs.
     """
+    model_config = ConfigDict(frozen=True)
+
     contradiction_detected: str = Field(
         ...,
         description="Binary verdict: 'Yes' or 'No'."
@@ -69,4 +78,100 @@ class ContradictionResponse(BaseModel):
     regulatory_reporting_draft: str = Field(
         ...,
         description="Draft narrative (max 200 words) for a potential regulatory submission (e.g., SUSAR or CIOMS)."
-    )
\ No newline at end of file
+    )
+
+class BatchRequest(BaseModel):
+    """Multiple analysis requests submitted in a single call."""
+    model_config = ConfigDict(frozen=True)
+
+    items: list[ContradictionRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="The contradiction requests to analyze concurrently (1 to 50)."
+    )
+
+
+class BatchResultItem(BaseModel):
+    """Outcome of a single item in a batch analysis."""
+    model_config = ConfigDict(frozen=True)
+
+    session_id: str = Field(
+        ...,
+        description="Session ID of the originating request."
+    )
+    result: ContradictionResponse | None = Field(
+        None,
+        description="The analysis result, or null if this item failed."
+    )
+    error: str | None = Field(
+        None,
+        description="Error detail if this item failed, otherwise null."
+    )
+
+
+class BatchResponse(BaseModel):
+    """Results of a batch analysis, in the same order as the submitted items."""
+    model_config = ConfigDict(frozen=True)
+
+    results: list[BatchResultItem]
+
+
+# --- Fast msgspec mirrors used to decode Gemini JSON output ---
+# Gemini returns schema-constrained JSON, so it is decoded with msgspec and
+# converted to the Pydantic models without a second validation pass. The
+# mirrors are generated from the Pydantic fields (names, types and numeric
+# bounds) so the two schemas cannot drift apart.
+BOUND_NAMES = ("gt", "ge", "lt", "le")
+
+
+def struct_field_type(annotation, structs: dict[type[BaseModel], type[msgspec.Struct]]):
+    """Maps a Pydantic field annotation onto its msgspec equivalent."""
+    if get_origin(annotation) is list:
+        (item,) = get_args(annotation)
+        return list[struct_field_type(item, structs)]
+    return structs.get(annotation, annotation)
+
+
+def struct_from_model(
+    model: type[BaseModel], structs: dict[type[BaseModel], type[msgspec.Struct]]
+) -> type[msgspec.Struct]:
+    """Builds a msgspec Struct with the same fields and bounds as `model`."""
+    fields = []
+    for name, info in model.model_fields.items():
+        field_type = struct_field_type(info.annotation, structs)
+        bounds = {
+            bound: getattr(constraint, bound)
+            for constraint in info.metadata
+            for bound in BOUND_NAMES
+            if hasattr(constraint, bound)
+        }
+        if bounds:
+            field_type = Annotated[field_type, msgspec.Meta(**bounds)]
+        fields.append((name, field_type))
+    struct = msgspec.defstruct(f"{model.__name__}Struct", fields)
+    structs[model] = struct
+    return struct
+
+
+MODEL_STRUCTS: dict[type[BaseModel], type[msgspec.Struct]] = {}
+HeatmapEntryStruct = struct_from_model(HeatmapEntry, MODEL_STRUCTS)
+ContradictionRequestStruct = struct_from_model(ContradictionRequest, MODEL_STRUCTS)
+ContradictionResponseStruct = struct_from_model(ContradictionResponse, MODEL_STRUCTS)
+
+
+def parse_contradiction_request(raw: str | bytes) -> ContradictionRequest:
+    """Decodes Gemini extraction output into a ContradictionRequest."""
+    data = msgspec.json.decode(raw, type=ContradictionRequestStruct)
+    return ContradictionRequest.model_construct(**msgspec.structs.asdict(data))
+
+
+def parse_contradiction_response(raw: str | bytes) -> ContradictionResponse:
+    """Decodes Gemini analysis output into a ContradictionResponse."""
+    data = msgspec.json.decode(raw, type=ContradictionResponseStruct)
+    fields = msgspec.structs.asdict(data)
+    fields["safety_contradiction_heatmap"] = [
+        HeatmapEntry.model_construct(**msgspec.structs.asdict(entry))
+        for entry in data.safety_contradiction_heatmap
+    ]
+    return ContradictionResponse.model_construct(**fields)
@@ -0,0 +1,70 @@
+# backend/pdf_worker.py
+"""
+PDF text extraction for the PDF process pool.
+
+All PyMuPDF work runs here, in worker processes: MuPDF is not thread-safe and
+holds the GIL while parsing. Kept separate from main.py so workers only import
+PyMuPDF, not the FastAPI app, its settings, or the Gemini client.
+"""
+import pymupdf
+
+# Pages with less text than this are treated as image-only (scanned) pages
+MIN_PAGE_TEXT_CHARS = 10
+SCANNED_PROBE_PAGES = 3
+
+
+def is_text_page(text: str) -> bool:
+    """True if a page's extracted text is more than scanner/whitespace noise."""
+    return len(text.strip()) >= MIN_PAGE_TEXT_CHARS
+
+
+def page_text(page: pymupdf.Page) -> str:
+    """Plain "text" mode with sort=False to skip layout analysis."""
+    return page.get_text("text", sort=False)
+
+
+def probe_pages(page_count: int) -> set[int]:
+    """Up to SCANNED_PROBE_PAGES page indices spread across the document."""
+    probe_count = min(SCANNED_PROBE_PAGES, page_count)
+    return {i * (page_count - 1) // max(probe_count - 1, 1) for i in range(probe_count)}
+
+
+def read_pdf(pdf_path: str, parallel_min_pages: int) -> tuple[int, list[str] | None, bool]:
+    """
+    Opens a PDF and returns (page_count, text_pages, scanned).
+    text_pages is None when the PDF has at least parallel_min_pages pages and
+    should be split into page ranges across workers instead. scanned is True
+    when no page yields text.
+    """
+    with pymupdf.open(pdf_path, filetype="pdf") as doc:
+        page_count = doc.page_count
+        texts: dict[int, str] = {}
+
+        def text_of(i: int) -> str:
+            if i not in texts:
+                texts[i] = page_text(doc[i])
+            return texts[i]
+
+        # If every probed page is image-only the PDF is probably a scan; confirm
+        # by stopping at the first page that has text, reusing pages already read
+        probably_scanned = page_count > 0 and all(
+            doc[i].get_images() and not is_text_page(text_of(i))
+            for i in probe_pages(page_count)
+        )
+        if probably_scanned and not any(
+            is_text_page(text_of(i)) for i in range(page_count)
+        ):
+            return page_count, [], True
+
+        if page_count >= parallel_min_pages:
+            return page_count, None, False
+
+        pages_text = [text_of(i) for i in range(page_count)]
+        return page_count, [text for text in pages_text if is_text_page(text)], False
+
+
+def extract_page_range(pdf_path: str, start: int, stop: int) -> list[str]:
+    """Extracts the text pages among pages [start, stop)."""
+    with pymupdf.open(pdf_path, filetype="pdf") as doc:
+        texts = (page_text(doc[i]) for i in range(start, stop))
+        return [text for text in texts if is_text_page(text)]